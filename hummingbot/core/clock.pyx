@@ -88,7 +88,9 @@ cdef class Clock:
     async def run_til(self, timestamp: float):
         cdef:
             TimeIterator child_iterator
-            double now = time.time()
+            object time_func = time.time
+            object sleep_func = asyncio.sleep
+            double now = time_func()
             double next_tick_time
 
         if self._current_context is None:
@@ -103,13 +105,13 @@ cdef class Clock:
 
         try:
             while True:
-                now = time.time()
+                now = time_func()
                 if now >= timestamp:
                     return
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                await sleep_func(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
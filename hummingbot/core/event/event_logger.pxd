@@ -5,7 +5,6 @@ cdef class EventLogger(EventListener):
     cdef:
         str _event_source
         object _logged_events
-        dict _waiting
-        dict _wait_returns
+        dict _waiters
     cdef c_call(self, object event_object)
 
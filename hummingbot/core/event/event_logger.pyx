@@ -15,8 +15,7 @@ cdef class EventLogger(EventListener):
         super().__init__()
         self._event_source = event_source
         self._logged_events = []
-        self._waiting = {}
-        self._wait_returns = {}
+        self._waiters = {}
 
     @property
     def event_log(self) -> List[any]:
@@ -30,28 +29,30 @@ cdef class EventLogger(EventListener):
         self._logged_events.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
-        notifier = asyncio.Event()
-        self._waiting[notifier] = event_type
-
-        async with timeout(timeout_seconds):
-            await notifier.wait()
-
-        retval = self._wait_returns.get(notifier)
-        if notifier in self._wait_returns:
-            del self._wait_returns[notifier]
-        return retval
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.setdefault(event_type, []).append(future)
+
+        try:
+            async with timeout(timeout_seconds):
+                return await future
+        finally:
+            # The logger may be shared across runs, so never leave a stale waiter behind.
+            waiters = self._waiters.get(event_type)
+            if waiters is not None and future in waiters:
+                waiters.remove(future)
+                if len(waiters) == 0:
+                    del self._waiters[event_type]
 
     def __call__(self, event_object):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
+        cdef list waiters
         self._logged_events.append(event_object)
-        event_object_type = type(event_object)
-
-        should_notify = []
-        for notifier, waiting_event_type in self._waiting.items():
-            if event_object_type is waiting_event_type:
-                should_notify.append(notifier)
-                self._wait_returns[notifier] = event_object
-        for notifier in should_notify:
-            notifier.set()
+
+        waiters = self._waiters.pop(type(event_object), None)
+        if waiters is None:
+            return
+        for future in waiters:
+            if not future.done():
+                future.set_result(event_object)
@@ -39,8 +39,14 @@ cdef class PubSub:
        make sense to do the GC every time.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners():
+       Every time. The function takes O(n) already.
+    4. c_trigger_event():
+       Only when a dead listener is encountered while dispatching.
+
+    c_trigger_event() dispatches over a cached tuple of listener weak references per event tag, so firing an event
+    doesn't need to copy the underlying C++ set. The cache entry for an event tag is dropped whenever its listeners
+    change.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +58,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        # Set up in __cinit__() since not every subclass calls PubSub.__init__().
+        self._listeners_cache = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -83,6 +93,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listeners_cache.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +111,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listeners_cache.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,11 +130,34 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
+        if lit_to_remove.size() > 0:
+            self._listeners_cache.pop(event_tag, None)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
+    cdef tuple c_get_cached_listener_refs(self, int64_t event_tag):
+        cdef:
+            tuple listener_refs = self._listeners_cache.get(event_tag)
+            EventsIterator it
+            list retval
+
+        if listener_refs is not None:
+            return listener_refs
+
+        self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        if it == self._events.end():
+            return ()
+
+        retval = []
+        for pyref in deref(it).second:
+            retval.append(<object>pyref.get())
+        listener_refs = tuple(retval)
+        self._listeners_cache[event_tag] = listener_refs
+        return listener_refs
+
     cdef c_get_listeners(self, int64_t event_tag):
         self.c_remove_dead_listeners(event_tag)
 
@@ -144,22 +179,20 @@ cdef class PubSub:
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            # The cached tuple is immutable, so listeners are free to call c_remove_listener() while being notified.
+            tuple listener_refs = self.c_get_cached_listener_refs(event_tag)
+            object listener_weakref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            bint has_dead_listeners = False
+
+        for listener_weakref in listener_refs:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                has_dead_listeners = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +200,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
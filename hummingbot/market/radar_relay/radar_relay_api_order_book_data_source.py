@@ -156,7 +156,9 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     self.logger().info(f"Initialized order book for {trading_pair}. "
                                        f"{index+1}/{number_of_pairs} completed.")
 
-                    await asyncio.sleep(0.9)
+                    # Pace the snapshot requests, but don't hold up the tracker after the last one.
+                    if index + 1 < number_of_pairs:
+                        await asyncio.sleep(0.9)
 
                 except Exception:
                     self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
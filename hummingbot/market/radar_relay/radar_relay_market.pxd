@@ -11,6 +11,7 @@ cdef class RadarRelayMarket(MarketBase):
         object _weth_token
         object _ev_loop
         object _poll_notifier
+        public object _ready_event
         double _last_timestamp
         double _last_update_limit_order_timestamp
         double _last_update_market_order_timestamp
@@ -23,6 +24,7 @@ cdef class RadarRelayMarket(MarketBase):
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
+        object _shared_client
         dict _withdraw_rules
         dict _trading_rules
         object _pending_approval_tx_hashes
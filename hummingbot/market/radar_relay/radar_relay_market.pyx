@@ -123,6 +123,7 @@ cdef class RadarRelayMarket(MarketBase):
                                                               trading_pairs=trading_pairs)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
+        self._ready_event = asyncio.Event()
         self._last_timestamp = 0
         self._last_update_limit_order_timestamp = 0
         self._last_update_market_order_timestamp = 0
@@ -144,6 +145,7 @@ cdef class RadarRelayMarket(MarketBase):
         self._wallet_spender_address = wallet_spender_address
         self._exchange = ZeroExExchange(self._w3, ZERO_EX_MAINNET_EXCHANGE_ADDRESS, wallet)
         self._latest_salt = -1
+        self._shared_client = None
 
     @property
     def name(self) -> str:
@@ -590,40 +592,48 @@ cdef class RadarRelayMarket(MarketBase):
             finally:
                 await asyncio.sleep(1.0)
 
+    async def _http_client(self) -> aiohttp.ClientSession:
+        """
+        :returns: Shared client session instance
+        """
+        if self._shared_client is None:
+            self._shared_client = aiohttp.ClientSession()
+        return self._shared_client
+
     async def _api_request(self,
                            http_method: str,
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None,
                            json: int = 0) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
-            async with (
-                    client.request(http_method,
-                                   url=url,
-                                   timeout=self.API_CALL_TIMEOUT,
-                                   data=data,
-                                   headers=headers) if json==0 else
-                    client.request(http_method,
-                                   url=url,
-                                   timeout=self.API_CALL_TIMEOUT,
-                                   json=data,
-                                   headers=headers)) as response:
-                try:
-                    if response.status == 201:
-                        return response
-                    elif response.status == 200:
-                        response_json = await response.json()
-                        return response_json
-                    else:
-                        raise IOError
-                except Exception:
-                    if response.status == 502:
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - Server Error: Bad Gateway.")
-                    else:
-                        response_text = await response.text()
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - {response_text}.")
+        client = await self._http_client()
+        async with (
+                client.request(http_method,
+                               url=url,
+                               timeout=self.API_CALL_TIMEOUT,
+                               data=data,
+                               headers=headers) if json==0 else
+                client.request(http_method,
+                               url=url,
+                               timeout=self.API_CALL_TIMEOUT,
+                               json=data,
+                               headers=headers)) as response:
+            try:
+                if response.status == 201:
+                    return response
+                elif response.status == 200:
+                    response_json = await response.json()
+                    return response_json
+                else:
+                    raise IOError
+            except Exception:
+                if response.status == 502:
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - Server Error: Bad Gateway.")
+                else:
+                    response_text = await response.text()
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - {response_text}.")
 
     async def request_signed_market_orders(self, trading_pair: str, trade_type: TradeType, amount: str) -> Dict[str, Any]:
         if trade_type is TradeType.BUY:
@@ -719,7 +729,8 @@ cdef class RadarRelayMarket(MarketBase):
         signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         await self._api_request(http_method="post", url=url, data=signed_limit_order, headers={"Content-Type": "application/json"}, json=1)
-        self._latest_salt = int(unsigned_limit_order["salt"])
+        # Limit orders may be submitted concurrently, so only ever move the cancel_all() cutoff forward.
+        self._latest_salt = max(self._latest_salt, int(unsigned_limit_order["salt"]))
         order_hash = self._w3.toHex(hexstr=order_hash_hex)
         del unsigned_limit_order["signature"]
         zero_ex_order = jsdict_to_order(unsigned_limit_order)
@@ -937,6 +948,7 @@ cdef class RadarRelayMarket(MarketBase):
             self._approval_tx_polling_task = safe_ensure_future(self._approval_tx_polling_loop())
 
     def _stop_network(self):
+        self._ready_event.clear()
         self._order_book_tracker.stop()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
@@ -972,6 +984,8 @@ cdef class RadarRelayMarket(MarketBase):
             if not self._poll_notifier.is_set():
                 self._poll_notifier.set()
         self.c_check_and_remove_expired_orders()
+        if not self._ready_event.is_set() and self.ready:
+            self._ready_event.set()
         self._last_timestamp = timestamp
 
     cdef c_start_tracking_limit_order(self,
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 from typing import (
+    Any,
     List,
     Dict,
     Optional,
@@ -55,6 +56,7 @@ class AccountBalanceWatcher(BaseWatcher):
         self._erc20_decimals: Dict[str, int] = {}
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._raw_account_balances: Dict[str, int] = {}
+        self._account_balances_cache: Optional[Dict[str, Decimal]] = None
 
     async def start_network(self):
         account_address: str = self._account_address
@@ -67,6 +69,7 @@ class AccountBalanceWatcher(BaseWatcher):
             self._raw_account_balances: Dict[str, int] = {
                 "ETH": await self.call_async(w3.eth.getBalance, account_address, app_warning_msg=app_warning_msg)
             }
+            self._account_balances_cache = None
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -74,15 +77,37 @@ class AccountBalanceWatcher(BaseWatcher):
 
         try:
             if len(self._erc20_contracts) < len(self._addresses_to_contracts):
-                for address, contract in self._addresses_to_contracts.items():
-                    contract: Contract = contract
-                    asset_name: str = await self.call_async(ERC20Token.get_symbol_from_contract, contract)
-                    decimals: int = await self.call_async(contract.functions.decimals().call)
-                    self._erc20_contracts[asset_name] = contract
+                # Issue the symbol, decimals and balance queries for every token at once, rather than waiting for
+                # each round trip to the Ethereum node in turn.
+                addresses: List[str] = list(self._addresses_to_contracts.keys())
+                token_info_tasks: List[Coroutine] = []
+                for address in addresses:
+                    contract: Contract = self._addresses_to_contracts[address]
+                    token_info_tasks.extend([
+                        self.call_async(ERC20Token.get_symbol_from_contract, contract),
+                        self.call_async(contract.functions.decimals().call),
+                        self.call_async(contract.functions.balanceOf(account_address).call)
+                    ])
+                # Collect failures per call, so that one bad token doesn't discard the results of the others.
+                token_infos: List[Any] = await safe_gather(*token_info_tasks, return_exceptions=True)
+                failed_tokens: List[str] = []
+                for i, address in enumerate(addresses):
+                    token_info: List[Any] = token_infos[i * 3:i * 3 + 3]
+                    errors: List[BaseException] = [result for result in token_info
+                                                   if isinstance(result, BaseException)]
+                    if len(errors) > 0:
+                        failed_tokens.append(f"{address} ({repr(errors[0])})")
+                        continue
+                    asset_name, decimals, raw_balance = token_info
+                    self._erc20_contracts[asset_name] = self._addresses_to_contracts[address]
                     self._erc20_decimals[asset_name] = decimals
-                    self._raw_account_balances[asset_name] = await self.call_async(
-                        contract.functions.balanceOf(account_address).call
+                    self._raw_account_balances[asset_name] = raw_balance
+                if len(failed_tokens) > 0:
+                    self.logger().network(
+                        f"Failed to get initial token information for {', '.join(failed_tokens)}.",
+                        app_warning_msg="Failed to get initial tokens information. Check Ethereum node connection."
                     )
+                self._account_balances_cache = None
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -105,8 +130,11 @@ class AccountBalanceWatcher(BaseWatcher):
         return self._raw_account_balances.copy()
 
     def get_all_balances(self) -> Dict[str, Decimal]:
-        return dict((asset_name, self.get_balance(asset_name))
-                    for asset_name in self._raw_account_balances.keys())
+        # Raw balances only change in start_network() and update_balances(), which reset the cache.
+        if self._account_balances_cache is None:
+            self._account_balances_cache = dict((asset_name, self.get_balance(asset_name))
+                                                for asset_name in self._raw_account_balances.keys())
+        return self._account_balances_cache.copy()
 
     def get_raw_balance(self, asset_name: str) -> int:
         return self._raw_account_balances.get(asset_name, 0)
@@ -145,6 +173,7 @@ class AccountBalanceWatcher(BaseWatcher):
             asset_raw_balances: List[int] = await safe_gather(*asset_update_tasks)
             for asset_name, raw_balance in zip(asset_symbols, asset_raw_balances):
                 self._raw_account_balances[asset_name] = raw_balance
+            self._account_balances_cache = None
         except asyncio.CancelledError:
             raise
         except Exception:
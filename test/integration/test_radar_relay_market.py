@@ -5,14 +5,14 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 
 import asyncio
 import conf
-import contextlib
 from decimal import Decimal
 import logging
 import os
 import time
 from typing import (
     List,
-    Optional
+    Optional,
+    Tuple
 )
 import unittest
 
@@ -38,9 +38,11 @@ from hummingbot.core.event.events import (
     TradeType,
     TradeFee,
 )
+from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
+    wait_til,
 )
 from hummingbot.logger import NETWORK
 from hummingbot.market.market_base import OrderType
@@ -60,7 +62,7 @@ s_decimal_0 = Decimal(0)
 
 
 class RadarRelayMarketUnitTest(unittest.TestCase):
-    market_events: List[MarketEvent] = [
+    market_events: Tuple[MarketEvent, ...] = (
         MarketEvent.ReceivedAsset,
         MarketEvent.BuyOrderCompleted,
         MarketEvent.SellOrderCompleted,
@@ -70,18 +72,21 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
         MarketEvent.OrderExpired,
         MarketEvent.OrderFilled,
         MarketEvent.WithdrawAsset,
-    ]
+    )
 
-    wallet_events: List[WalletEvent] = [
+    wallet_events: Tuple[WalletEvent, ...] = (
         WalletEvent.WrappedEth,
         WalletEvent.UnwrappedEth
-    ]
+    )
 
     wallet: Web3Wallet
     market: RadarRelayMarket
     market_logger: EventLogger
     wallet_logger: EventLogger
-    stack: contextlib.ExitStack
+    clock_task: asyncio.Task
+
+    MARKET_READY_TIMEOUT = 180.0
+    RUN_PARALLEL_TIMEOUT = 600.0
 
     @classmethod
     def setUpClass(cls):
@@ -100,25 +105,40 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
         cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         cls.clock.add_iterator(cls.wallet)
         cls.clock.add_iterator(cls.market)
-        cls.stack = contextlib.ExitStack()
-        cls._clock = cls.stack.enter_context(cls.clock)
+        market_logger = cls.market_logger = EventLogger()
+        wallet_logger = cls.wallet_logger = EventLogger()
+        add_market_listener = cls.market.add_listener
+        for event_tag in cls.market_events:
+            add_market_listener(event_tag, market_logger)
+        add_wallet_listener = cls.wallet.add_listener
+        for event_tag in cls.wallet_events:
+            add_wallet_listener(event_tag, wallet_logger)
+        cls.clock.__enter__()
+        # The clock schedules its own ticks for as long as the event loop is running a test.
+        cls.clock_task = safe_ensure_future(cls.clock.run(), loop=cls.ev_loop)
         cls.ev_loop.run_until_complete(cls.wait_til_ready())
         print("Ready.")
 
     @classmethod
     def tearDownClass(cls) -> None:
-        cls.stack.close()
+        market_logger = cls.market_logger
+        remove_market_listener = cls.market.remove_listener
+        for event_tag in cls.market_events:
+            remove_market_listener(event_tag, market_logger)
+        wallet_logger = cls.wallet_logger
+        remove_wallet_listener = cls.wallet.remove_listener
+        for event_tag in cls.wallet_events:
+            remove_wallet_listener(event_tag, wallet_logger)
+        cls.clock_task.cancel()
+        try:
+            cls.ev_loop.run_until_complete(cls.clock_task)
+        except asyncio.CancelledError:
+            pass
+        cls.clock.__exit__(None, None, None)
 
     @classmethod
     async def wait_til_ready(cls):
-        while True:
-            now = time.time()
-            next_iteration = now // 1.0 + 1
-            if cls.market.ready:
-                break
-            else:
-                await cls._clock.run_til(next_iteration)
-            await asyncio.sleep(1.0)
+        await asyncio.wait_for(cls.market._ready_event.wait(), timeout=cls.MARKET_READY_TIMEOUT)
 
     def setUp(self):
         self.db_path: str = realpath(join(__file__, "../radar_relay_test.sqlite"))
@@ -127,28 +147,20 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
         except FileNotFoundError:
             pass
 
-        self.market_logger = EventLogger()
-        self.wallet_logger = EventLogger()
-        for event_tag in self.market_events:
-            self.market.add_listener(event_tag, self.market_logger)
-        for event_tag in self.wallet_events:
-            self.wallet.add_listener(event_tag, self.wallet_logger)
-
-    def tearDown(self):
-        for event_tag in self.market_events:
-            self.market.remove_listener(event_tag, self.market_logger)
-        self.market_logger = None
-        for event_tag in self.wallet_events:
-            self.wallet.remove_listener(event_tag, self.wallet_logger)
-        self.wallet_logger = None
+        self.market_logger.clear()
+        self.wallet_logger.clear()
 
     async def run_parallel_async(self, *tasks):
-        future: asyncio.Future = safe_ensure_future(safe_gather(*tasks))
-        while not future.done():
-            now = time.time()
-            next_iteration = now // 1.0 + 1
-            await self._clock.run_til(next_iteration)
-            await asyncio.sleep(1.0)
+        future: asyncio.Future = safe_ensure_future(safe_gather(*tasks), loop=self.ev_loop)
+        done, _ = await asyncio.wait({future, self.clock_task},
+                                     timeout=self.RUN_PARALLEL_TIMEOUT,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        if future not in done:
+            future.cancel()
+            if self.clock_task.done():
+                # safe_ensure_future() has already logged why the clock stopped; fail now rather than time out.
+                raise RuntimeError("Clock task exited before the tasks completed.")
+            raise asyncio.TimeoutError(f"Tasks did not complete within {self.RUN_PARALLEL_TIMEOUT} seconds.")
         return future.result()
 
     def run_parallel(self, *tasks):
@@ -180,9 +192,9 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
                                        price=current_price * Decimal("0.8"),
                                        expiration_ts=expires)
         [buy_order_opened_event] = self.run_parallel(self.market_logger.wait_for(BuyOrderCreatedEvent))
-        self.assertEqual("ZRX-WETH", buy_order_opened_event.trading_pair)
+        self.assertEqual(trading_pair, buy_order_opened_event.trading_pair)
         self.assertEqual(OrderType.LIMIT, buy_order_opened_event.type)
-        self.assertEqual(quantized_amount, Decimal(buy_order_opened_event.amount))
+        self.assertEqual(quantized_amount, buy_order_opened_event.amount)
 
         self.run_parallel(self.market.cancel_order(buy_order_id))
         [buy_order_cancelled_event] = self.run_parallel(self.market_logger.wait_for(OrderCancelledEvent))
@@ -197,34 +209,34 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
         amount: Decimal = Decimal(10)
         expires = int(time.time() + 60 * 5)
         quantized_amount: Decimal = self.market.quantize_order_amount(trading_pair, amount)
+        # The two limit orders are independent, so submit both before waiting for either to be created.
         buy_order_id = self.market.buy(trading_pair=trading_pair,
                                        amount=amount,
                                        order_type=OrderType.LIMIT,
                                        price=current_price * Decimal("0.8"),
                                        expiration_ts=expires)
-        [buy_order_opened_event] = self.run_parallel(self.market_logger.wait_for(BuyOrderCreatedEvent))
-        self.assertEqual(buy_order_id, buy_order_opened_event.order_id)
-        self.assertEqual(quantized_amount, Decimal(buy_order_opened_event.amount))
-        self.assertEqual("ZRX-WETH", buy_order_opened_event.trading_pair)
-        self.assertEqual(OrderType.LIMIT, buy_order_opened_event.type)
-
-        # Reset the logs
-        self.market_logger.clear()
-
         sell_order_id = self.market.sell(trading_pair=trading_pair,
                                          amount=amount,
                                          order_type=OrderType.LIMIT,
                                          price=current_price * Decimal("1.2"),
                                          expiration_ts=expires)
-        [sell_order_opened_event] = self.run_parallel(self.market_logger.wait_for(SellOrderCreatedEvent))
+        [buy_order_opened_event, sell_order_opened_event] = self.run_parallel(
+            self.market_logger.wait_for(BuyOrderCreatedEvent),
+            self.market_logger.wait_for(SellOrderCreatedEvent)
+        )
+        self.assertEqual(buy_order_id, buy_order_opened_event.order_id)
+        self.assertEqual(quantized_amount, buy_order_opened_event.amount)
+        self.assertEqual(trading_pair, buy_order_opened_event.trading_pair)
+        self.assertEqual(OrderType.LIMIT, buy_order_opened_event.type)
         self.assertEqual(sell_order_id, sell_order_opened_event.order_id)
-        self.assertEqual(quantized_amount, Decimal(sell_order_opened_event.amount))
-        self.assertEqual("ZRX-WETH", sell_order_opened_event.trading_pair)
+        self.assertEqual(quantized_amount, sell_order_opened_event.amount)
+        self.assertEqual(trading_pair, sell_order_opened_event.trading_pair)
         self.assertEqual(OrderType.LIMIT, sell_order_opened_event.type)
 
         [cancellation_results] = self.run_parallel(self.market.cancel_all(60 * 5))
-        self.assertEqual(cancellation_results[0], CancellationResult(buy_order_id, True))
-        self.assertEqual(cancellation_results[1], CancellationResult(sell_order_id, True))
+        # Either order may have been tracked first, since they were submitted concurrently.
+        self.assertCountEqual([CancellationResult(buy_order_id, True), CancellationResult(sell_order_id, True)],
+                              cancellation_results)
         # Reset the logs
         self.market_logger.clear()
 
@@ -240,7 +252,7 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
                         expiration_ts=expires)
         [buy_order_opened_event] = self.run_parallel(self.market_logger.wait_for(BuyOrderCreatedEvent))
 
-        self.assertEqual("ZRX-WETH", buy_order_opened_event.trading_pair)
+        self.assertEqual(trading_pair, buy_order_opened_event.trading_pair)
         self.assertEqual(OrderType.LIMIT, buy_order_opened_event.type)
         [buy_order_expired_event] = self.run_parallel(self.market_logger.wait_for(OrderExpiredEvent, 60 * 3))
         self.assertEqual(buy_order_opened_event.order_id, buy_order_expired_event.order_id)
@@ -260,7 +272,7 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
 
         self.assertTrue([evt.order_type == OrderType.MARKET for evt in order_filled_events])
         self.assertEqual(order_id, order_completed_event.order_id)
-        self.assertEqual(float(quantized_amount), float(order_completed_event.base_asset_amount))
+        self.assertEqual(quantized_amount, order_completed_event.base_asset_amount)
         self.assertEqual("ZRX", order_completed_event.base_asset)
         self.assertEqual("WETH", order_completed_event.quote_asset)
         self.market_logger.clear()
@@ -277,7 +289,7 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
 
         self.assertTrue([evt.order_type == OrderType.MARKET for evt in order_filled_events])
         self.assertEqual(order_id, order_completed_event.order_id)
-        self.assertEqual(float(quantized_amount), float(order_completed_event.base_asset_amount))
+        self.assertEqual(quantized_amount, order_completed_event.base_asset_amount)
         self.assertEqual("ZRX", order_completed_event.base_asset)
         self.assertEqual("WETH", order_completed_event.quote_asset)
         self.market_logger.clear()
@@ -308,6 +320,8 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
         trading_pair: str = "ZRX-WETH"
         sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
         order_id: Optional[str] = None
+        placed_order_id: Optional[str] = None
+        original_market: RadarRelayMarket = self.market
         recorder: MarketsRecorder = MarketsRecorder(sql, [self.market], config_path, strategy_name)
         recorder.start()
 
@@ -325,6 +339,7 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
             expires = int(time.time() + 60 * 5)
             order_id = self.market.buy(trading_pair, quantized_amount, OrderType.LIMIT, quantize_bid_price,
                                        expiration_ts=expires)
+            placed_order_id = order_id
             [order_created_event] = self.run_parallel(self.market_logger.wait_for(BuyOrderCreatedEvent))
             order_created_event: BuyOrderCreatedEvent = order_created_event
             self.assertEqual(order_id, order_created_event.order_id)
@@ -381,6 +396,29 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
                 self.market.cancel(trading_pair, order_id)
                 self.run_parallel(self.market_logger.wait_for(OrderCancelledEvent))
 
+            # Swap the replacement market back out, so it stops feeding the shared logger for the rest of the class.
+            if self.market is not original_market:
+                for event_tag in self.market_events:
+                    self.market.remove_listener(event_tag, self.market_logger)
+                if self.market in self.clock.child_iterators:
+                    self.clock.remove_iterator(self.market)
+                del self.market
+            if original_market not in self.clock.child_iterators:
+                # The replacement market took over and cancelled this order. Stop tracking it here, otherwise the
+                # original market reports the cancellation again once its status polling restarts.
+                if placed_order_id is not None:
+                    original_market.in_flight_limit_orders.pop(placed_order_id, None)
+                for event_tag in self.market_events:
+                    original_market.add_listener(event_tag, self.market_logger)
+                self.clock.add_iterator(original_market)
+                # Removing the market from the clock stopped its network. Its order books, balances and trading
+                # rules survive that, so `ready` alone says nothing; wait until the network check loop has actually
+                # reconnected and restarted the status polling.
+                self.run_parallel(wait_til(lambda: original_market.network_status is NetworkStatus.CONNECTED and
+                                           original_market._status_polling_task is not None and
+                                           original_market._ready_event.is_set(),
+                                           timeout=self.MARKET_READY_TIMEOUT))
+
             recorder.stop()
             os.unlink(self.db_path)
 
@@ -404,7 +442,7 @@ class RadarRelayMarketUnitTest(unittest.TestCase):
             self.market_logger.clear()
 
             # Try to sell back the same amount of ZRX to the exchange, and watch for completion event.
-            amount = Decimal(buy_order_completed_event.base_asset_amount)
+            amount = buy_order_completed_event.base_asset_amount
             order_id = self.market.sell(trading_pair, amount)
             [sell_order_completed_event] = self.run_parallel(self.market_logger.wait_for(SellOrderCompletedEvent))
 